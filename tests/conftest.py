@@ -8,15 +8,15 @@ import pytest
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     return Path(__file__).parent.parent
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def terraform_dir(project_root: Path) -> Path:
     return project_root / "terraform"
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def run_command():
     def _run_command(cmd: list[str], cwd: Path | None = None, check: bool = True,
                      capture_output: bool = True, timeout: int = 300) -> subprocess.CompletedProcess:
@@ -25,7 +25,18 @@ def run_command():
                               text=True, timeout=timeout)
     return _run_command
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def terraform_sources(terraform_dir: Path) -> dict[str, str]:
+    return {p.name: p.read_text() for p in terraform_dir.glob("*.tf")}
+
+@pytest.fixture(scope="session")
+def terraform_initialized(terraform_dir: Path, run_command) -> Path:
+    init = run_command(["terraform", "init", "-backend=false"], cwd=terraform_dir, check=False)
+    if init.returncode != 0:
+        pytest.skip("Terraform init failed")
+    return terraform_dir
+
+@pytest.fixture(scope="session")
 def check_hugepages() -> dict[str, Any]:
     result = {"total_pages": 0, "free_pages": 0, "page_size_kb": 0,
               "total_memory_gb": 0, "free_memory_gb": 0, "errors": []}
@@ -46,7 +57,7 @@ def check_hugepages() -> dict[str, Any]:
         result["errors"].append(str(e))
     return result
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def check_packages(run_command) -> dict[str, Any]:
     packages = ["qemu-kvm", "libvirt-daemon", "libvirt-clients", "virtinst", "openvswitch-switch"]
     result = {"installed": [], "missing": [], "errors": []}
@@ -61,7 +72,7 @@ def check_packages(run_command) -> dict[str, Any]:
             result["errors"].append(f"{pkg}: {e}")
     return result
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def skip_unless_host():
     def _skip(reason: str = "Test requires Bizon host"):
         import os
@@ -14,12 +14,29 @@ Test Categories:
 """
 
 import pytest
+import re
+import shutil
 import subprocess
 import os
 from pathlib import Path
 from typing import Any
 
 
+pytestmark = pytest.mark.infrastructure
+
+
+@pytest.fixture(scope="module")
+def nvidia_gpu_addresses() -> list[str]:
+    """PCI addresses (with domain) of all NVIDIA devices, looked up once."""
+    result = subprocess.run(
+        ["lspci", "-d", "10de:", "-n"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        return []
+    return [f"0000:{line.split()[0]}" for line in result.stdout.strip().split('\n') if line]
+
+
 # =============================================================================
 # IOMMU Validation Tests
 # =============================================================================
@@ -27,7 +44,6 @@ from typing import Any
 class TestIOMMU:
     """Test IOMMU configuration for GPU passthrough."""
     
-    @pytest.mark.infrastructure
     def test_iommu_enabled(self) -> None:
         """Verify IOMMU is enabled in kernel."""
         iommu_path = Path("/sys/class/iommu")
@@ -37,7 +53,6 @@ class TestIOMMU:
         iommu_devices = list(iommu_path.iterdir())
         assert len(iommu_devices) > 0, "No IOMMU devices found"
     
-    @pytest.mark.infrastructure
     def test_iommu_groups_exist(self) -> None:
         """Verify IOMMU groups are created."""
         iommu_groups = Path("/sys/kernel/iommu_groups")
@@ -46,26 +61,15 @@ class TestIOMMU:
         groups = list(iommu_groups.iterdir())
         assert len(groups) > 0, "No IOMMU groups found"
     
-    @pytest.mark.infrastructure
-    def test_gpu_iommu_isolation(self) -> None:
+    def test_gpu_iommu_isolation(self, nvidia_gpu_addresses: list[str]) -> None:
         """Verify each GPU is in its own IOMMU group (ideal for passthrough)."""
-        result = subprocess.run(
-            ["lspci", "-d", "10de:", "-n"],
-            capture_output=True, text=True
-        )
-        
-        if result.returncode != 0 or not result.stdout.strip():
+        gpu_addresses = nvidia_gpu_addresses
+        if not gpu_addresses:
             pytest.skip("No NVIDIA GPUs found")
         
-        gpu_addresses = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                addr = line.split()[0]
-                gpu_addresses.append(addr)
-        
         gpu_groups = set()
         for addr in gpu_addresses:
-            iommu_link = Path(f"/sys/bus/pci/devices/0000:{addr}/iommu_group")
+            iommu_link = Path(f"/sys/bus/pci/devices/{addr}/iommu_group")
             if iommu_link.exists():
                 group = iommu_link.resolve().name
                 gpu_groups.add(group)
@@ -73,7 +77,6 @@ class TestIOMMU:
         assert len(gpu_groups) >= len(gpu_addresses) // 2, \
             f"GPUs may not be properly isolated. Groups: {len(gpu_groups)}, GPUs: {len(gpu_addresses)}"
     
-    @pytest.mark.infrastructure
     def test_vfio_modules_available(self) -> None:
         """Verify VFIO modules are available."""
         result = subprocess.run(
@@ -93,7 +96,6 @@ class TestHugePagesExtended:
     EXPECTED_HUGEPAGES_GB = 900
     HUGEPAGE_SIZE_KB = 2048
     
-    @pytest.mark.infrastructure
     def test_transparent_hugepages_disabled(self) -> None:
         """Verify Transparent HugePages is disabled (recommended for VMs)."""
         thp_path = Path("/sys/kernel/mm/transparent_hugepage/enabled")
@@ -104,7 +106,6 @@ class TestHugePagesExtended:
         assert "[never]" in content or "[madvise]" in content, \
             f"THP should be disabled or madvise for VM workloads: {content}"
     
-    @pytest.mark.infrastructure
     def test_hugepages_persistence(self) -> None:
         """Verify HugePages are configured to persist across reboots."""
         sysctl_conf = Path("/etc/sysctl.conf")
@@ -132,7 +133,6 @@ class TestHugePagesExtended:
 class TestLibvirtService:
     """Test libvirt service configuration."""
     
-    @pytest.mark.infrastructure
     def test_libvirtd_running(self) -> None:
         """Verify libvirtd service is running."""
         result = subprocess.run(
@@ -141,7 +141,6 @@ class TestLibvirtService:
         )
         assert result.stdout.strip() == "active", "libvirtd service not running"
     
-    @pytest.mark.infrastructure
     def test_libvirt_connection(self) -> None:
         """Verify libvirt connection works."""
         result = subprocess.run(
@@ -150,7 +149,6 @@ class TestLibvirtService:
         )
         assert result.returncode == 0, f"Cannot connect to libvirt: {result.stderr}"
     
-    @pytest.mark.infrastructure
     def test_default_storage_pool(self) -> None:
         """Verify default storage pool exists."""
         result = subprocess.run(
@@ -166,6 +164,36 @@ class TestLibvirtService:
 # VM Validation Tests
 # =============================================================================
 
+_CONTROL_PLANE_RE = re.compile(r"control|cp", re.IGNORECASE)
+_GPU_RE = re.compile(r"gpu", re.IGNORECASE)
+_WORKER_RE = re.compile(r"worker", re.IGNORECASE)
+
+
+@pytest.fixture(scope="module")
+def vm_roles() -> dict[str, list[str]]:
+    """List all VMs once and bucket them by role in a single pass."""
+    roles: dict[str, list[str]] = {"all": [], "control_plane": [], "worker": [], "gpu_worker": []}
+    result = subprocess.run(
+        ["virsh", "-c", "qemu:///system", "list", "--all", "--name"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return roles
+    
+    for vm in result.stdout.strip().split('\n'):
+        if not vm:
+            continue
+        roles["all"].append(vm)
+        is_gpu = _GPU_RE.search(vm) is not None
+        if _CONTROL_PLANE_RE.search(vm):
+            roles["control_plane"].append(vm)
+        if is_gpu:
+            roles["gpu_worker"].append(vm)
+        elif _WORKER_RE.search(vm):
+            roles["worker"].append(vm)
+    return roles
+
+
 class TestVMs:
     """Test VM configuration (run after VMs are deployed)."""
     
@@ -174,53 +202,25 @@ class TestVMs:
     EXPECTED_GPU_WORKERS = 8
     EXPECTED_TOTAL = 24
     
-    def _get_vm_list(self) -> list[str]:
-        """Get list of all VMs."""
-        result = subprocess.run(
-            ["virsh", "-c", "qemu:///system", "list", "--all", "--name"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            return []
-        return [vm for vm in result.stdout.strip().split('\n') if vm]
-    
-    @pytest.mark.infrastructure
-    def test_control_plane_vms_exist(self) -> None:
-        """Verify control plane VMs are deployed."""
-        vms = self._get_vm_list()
-        if not vms:
-            pytest.skip("No VMs deployed yet (Task F10.1.7)")
-        
-        control_plane = [vm for vm in vms if "control" in vm.lower() or "cp" in vm.lower()]
-        assert len(control_plane) >= self.EXPECTED_CONTROL_PLANE, \
-            f"Expected {self.EXPECTED_CONTROL_PLANE} control plane VMs, found {len(control_plane)}"
-    
-    @pytest.mark.infrastructure
-    def test_worker_vms_exist(self) -> None:
-        """Verify worker VMs are deployed."""
-        vms = self._get_vm_list()
-        if not vms:
-            pytest.skip("No VMs deployed yet (Task F10.1.8)")
-        
-        workers = [vm for vm in vms if "worker" in vm.lower() and "gpu" not in vm.lower()]
-        assert len(workers) >= self.EXPECTED_WORKERS, \
-            f"Expected {self.EXPECTED_WORKERS} worker VMs, found {len(workers)}"
-    
-    @pytest.mark.infrastructure
-    def test_gpu_worker_vms_exist(self) -> None:
-        """Verify GPU worker VMs are deployed."""
-        vms = self._get_vm_list()
-        if not vms:
-            pytest.skip("No VMs deployed yet (Task F10.1.9)")
+    @pytest.mark.parametrize(("role", "expected", "task"), [
+        ("control_plane", EXPECTED_CONTROL_PLANE, "F10.1.7"),
+        ("worker", EXPECTED_WORKERS, "F10.1.8"),
+        ("gpu_worker", EXPECTED_GPU_WORKERS, "F10.1.9"),
+    ])
+    def test_role_vms_exist(self, vm_roles: dict[str, list[str]], role: str,
+                            expected: int, task: str) -> None:
+        """Verify control plane, worker and GPU worker VMs are deployed."""
+        if not vm_roles["all"]:
+            pytest.skip(f"No VMs deployed yet (Task {task})")
         
-        gpu_workers = [vm for vm in vms if "gpu" in vm.lower()]
-        assert len(gpu_workers) >= self.EXPECTED_GPU_WORKERS, \
-            f"Expected {self.EXPECTED_GPU_WORKERS} GPU worker VMs, found {len(gpu_workers)}"
+        found = vm_roles[role]
+        label = role.replace("_", " ")
+        assert len(found) >= expected, \
+            f"Expected {expected} {label} VMs, found {len(found)}"
     
-    @pytest.mark.infrastructure
-    def test_total_vm_count(self) -> None:
+    def test_total_vm_count(self, vm_roles: dict[str, list[str]]) -> None:
         """Verify total VM count."""
-        vms = self._get_vm_list()
+        vms = vm_roles["all"]
         if not vms:
             pytest.skip("No VMs deployed yet")
         
@@ -235,7 +235,6 @@ class TestVMs:
 class TestGPUPassthrough:
     """Test GPU passthrough configuration."""
     
-    @pytest.mark.infrastructure
     def test_nvidia_gpus_detected(self) -> None:
         """Verify NVIDIA GPUs are detected."""
         result = subprocess.run(
@@ -247,23 +246,12 @@ class TestGPUPassthrough:
         gpus = [line for line in result.stdout.split('\n') if line]
         assert len(gpus) > 0, "No NVIDIA GPUs detected"
     
-    @pytest.mark.infrastructure
-    def test_gpu_driver_binding(self) -> None:
+    def test_gpu_driver_binding(self, nvidia_gpu_addresses: list[str]) -> None:
         """Verify GPUs for passthrough are bound to vfio-pci."""
-        result = subprocess.run(
-            ["lspci", "-d", "10de:", "-n"],
-            capture_output=True, text=True
-        )
-        
-        if result.returncode != 0 or not result.stdout.strip():
+        gpu_addresses = nvidia_gpu_addresses
+        if not gpu_addresses:
             pytest.skip("No NVIDIA GPUs found")
         
-        gpu_addresses = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                addr = line.split()[0]
-                gpu_addresses.append(f"0000:{addr}")
-        
         vfio_bound = 0
         nvidia_bound = 0
         for addr in gpu_addresses:
@@ -290,7 +278,6 @@ class TestOVSNetworking:
     
     VSF_BRIDGE = "br-vsf"
     
-    @pytest.mark.infrastructure
     def test_ovs_service_running(self) -> None:
         """Verify OVS service is running."""
         result = subprocess.run(
@@ -299,7 +286,6 @@ class TestOVSNetworking:
         )
         assert result.stdout.strip() == "active", "OVS service not running"
     
-    @pytest.mark.infrastructure
     def test_vsf_bridge_exists(self) -> None:
         """Verify VSF bridge exists."""
         result = subprocess.run(
@@ -309,7 +295,6 @@ class TestOVSNetworking:
         if result.returncode != 0:
             pytest.skip(f"OVS bridge {self.VSF_BRIDGE} not yet created (Task F10.1.10)")
     
-    @pytest.mark.infrastructure
     def test_ovs_flows_configured(self) -> None:
         """Verify OVS flows are configured."""
         result = subprocess.run(
@@ -330,7 +315,6 @@ class TestOVSNetworking:
 class TestVirtualBMC:
     """Test VirtualBMC configuration."""
     
-    @pytest.mark.infrastructure
     def test_virtualbmc_available(self) -> None:
         """Verify VirtualBMC is installed."""
         result = subprocess.run(
@@ -340,7 +324,6 @@ class TestVirtualBMC:
         if result.returncode != 0:
             pytest.skip("VirtualBMC not yet configured (Task F10.1.5)")
     
-    @pytest.mark.infrastructure
     def test_vms_registered_with_vbmc(self) -> None:
         """Verify VMs are registered with VirtualBMC."""
         result = subprocess.run(
@@ -357,14 +340,9 @@ class TestVirtualBMC:
         vm_count = len([l for l in lines if "running" in l.lower() or "down" in l.lower()])
         assert vm_count > 0, "No VMs registered with VirtualBMC"
     
-    @pytest.mark.infrastructure
     def test_ipmitool_installed(self) -> None:
         """Verify ipmitool is installed (for BMC testing)."""
-        result = subprocess.run(
-            ["which", "ipmitool"],
-            capture_output=True, text=True
-        )
-        assert result.returncode == 0, "ipmitool not installed"
+        assert shutil.which("ipmitool") is not None, "ipmitool not installed"
 
 
 # =============================================================================
@@ -374,7 +352,6 @@ class TestVirtualBMC:
 class TestIntegration:
     """Integration tests for end-to-end functionality."""
     
-    @pytest.mark.infrastructure
     @pytest.mark.integration
     def test_vm_can_be_controlled_via_ipmi(self) -> None:
         """Verify a VM can be controlled via IPMI (through VirtualBMC)."""